@@ -1,25 +1,60 @@
 import psutil
 import argparse
 import time
-import os
+import sys
 from colorama import Fore, Back, init
 from datetime import datetime
 import socket
 import csv
-
+import functools
+import io
+import heapq
+import operator
+
+_CLEAR = "\x1b[H\x1b[2J"
+_LB = Fore.LIGHTBLUE_EX
+_FR = Fore.RESET
+_BR = Back.RESET
+_BLB = Back.LIGHTBLUE_EX
+_BLBK = Back.LIGHTBLACK_EX
+_RED = Fore.RED
+_HDR_BAR = f"{_BLB}{' ' * 80}{_BR}"
+_ROW_FMT = "{bg}{pid:>7} {name:<35.35} {cpu_color}{cpu:>7.2f}" + _FR + " {mem:>7.2f} {read:>10} {write:>10}" + _BR
+_get_cpu = operator.itemgetter('cpu_percent')
+
+_UNITS = (('', 1.0), ('K', 1024.0), ('M', 1048576.0), ('G', 1073741824.0), ('T', 1099511627776.0))
 
 def format_bytes(byte_count, is_rate=True):
     """Converts bytes to a human-readable string (KB, MB, GB, TB)."""
     if byte_count is None:
         return "N/A"
-    power = 1024
-    n = 0
-    power_labels = {0: '', 1: 'K', 2: 'M', 3: 'G', 4: 'T'}
-    while byte_count >= power and n < len(power_labels) - 1:
-        byte_count /= power
-        n += 1
-    suffix = "B/s" if is_rate else "B"
-    return f"{byte_count:.2f}{power_labels[n]}{suffix}"
+    return _format_bytes_cached(round(byte_count, 2), is_rate)
+
+@functools.lru_cache(maxsize=2048)
+def _format_bytes_cached(byte_count, is_rate):
+    """Formats an already rounded byte count; memoized since idle rates repeat every tick."""
+    n = max(0, min(4, (int(byte_count).bit_length() - 1) // 10))
+    label, div = _UNITS[n]
+    return f"{byte_count / div:.2f}{label}{'B/s' if is_rate else 'B'}"
+
+_proc_cache = {}
+
+def iter_processes():
+    """Yields a Process for every running PID without the per-PID reuse check older psutil versions do."""
+    if psutil.version_info >= (6, 0):
+        yield from psutil.process_iter()
+        return
+    pids = psutil.pids()
+    for pid in _proc_cache.keys() - set(pids):
+        del _proc_cache[pid]
+    for pid in pids:
+        proc = _proc_cache.get(pid)
+        if proc is None:
+            try:
+                proc = _proc_cache[pid] = psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                continue
+        yield proc
 
 def parse_arguments():
     """Parses command-line arguments."""
@@ -35,7 +70,8 @@ def setup_csv_export(filename):
     if not filename:
         return None, None
     try:
-        csv_file = open(filename, 'w', newline='', encoding='utf-8')
+        raw = open(filename, 'wb', buffering=0)
+        csv_file = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=1 << 18), encoding='utf-8', newline='', write_through=False)
         csv_writer = csv.writer(csv_file)
         csv_writer.writerow(['Timestamp', 'Overall CPU %', 'Overall MEM %', 'Net Sent (B/s)', 'Net Recv (B/s)',
                              'PID', 'Process Name', 'Process CPU %', 'Process MEM %', 'Read (B/s)', 'Write (B/s)'])
@@ -49,11 +85,26 @@ class RealNerdStats:
     def __init__(self, args):
         self.args = args
         self.last_io_counters = {}
-        self.last_net_counters = psutil.net_io_counters()
-        self.last_disk_io_counters = psutil.disk_io_counters()
+        self.last_net_counters = psutil.net_io_counters(pernic=False, nowrap=True)
+        self.last_disk_io_counters = psutil.disk_io_counters(perdisk=False, nowrap=True)
+        self._last_sample_time = time.monotonic()
+        self._elapsed = args.interval
+        self._core_prefixes = [f"{_LB}Core {i}:{_FR} " for i in range(len(psutil.cpu_percent(interval=None, percpu=True)))]
         self.system_stats = {}
         self.top_processes = []
+        self._tick = 0
+        self._static = {
+            'cpu_cores_physical': psutil.cpu_count(logical=False),
+            'cpu_cores_logical': psutil.cpu_count(logical=True),
+            'boot_time': psutil.boot_time(),
+            'disk_partitions_list': list(psutil.disk_partitions()),
+        }
+        self._system_stats_cache = {}
+        self._cached_sysinfo_str, self._cached_sysinfo_tick = None, 0
+        self._cached_netinfo_str, self._cached_netinfo_tick = None, 0
+        self._process_header_row = f"{_LB}{'PID':>7} {'PROCESS NAME':<35} {'CPU %':>7} {'MEM %':>7} {'READ/s':>10} {'WRITE/s':>10}{_FR}"
         self.csv_file, self.csv_writer = setup_csv_export(args.export)
+        self._csv_tick = 0
         init(autoreset=True)
 
     def _get_sensor_data(self, sensor_func):
@@ -67,105 +118,122 @@ class RealNerdStats:
         """Gathers and returns system-wide statistics."""
         virtual_mem = psutil.virtual_memory()
         swap_mem = psutil.swap_memory()
-        per_cpu = psutil.cpu_percent(interval=0.1, percpu=True)
+        per_cpu = psutil.cpu_percent(interval=None, percpu=True)
         self.system_stats = {
             'overall_cpu': sum(per_cpu) / len(per_cpu),
             'overall_mem': virtual_mem.percent,
             'per_cpu_usage': per_cpu,
-            'cpu_cores_physical': psutil.cpu_count(logical=False),
-            'cpu_cores_logical': psutil.cpu_count(logical=True),
+            'cpu_cores_physical': self._static['cpu_cores_physical'],
+            'cpu_cores_logical': self._static['cpu_cores_logical'],
             'cpu_frequency': psutil.cpu_freq(),
             'virtual_memory': virtual_mem,
             'swap_memory': swap_mem,
-            'boot_time': psutil.boot_time(),
-            'users': psutil.users(),
-            'sensors_temperatures': self._get_sensor_data(lambda: psutil.sensors_temperatures()),
-            'sensors_fans': self._get_sensor_data(lambda: psutil.sensors_fans()),
-            'sensors_battery': self._get_sensor_data(lambda: psutil.sensors_battery()),
+            'boot_time': self._static['boot_time'],
         }
 
         if self.args.network:
-            self.system_stats['net_if_addrs'] = psutil.net_if_addrs()
-            self.system_stats['net_if_stats'] = psutil.net_if_stats()
-            self.system_stats['net_connections'] = psutil.net_connections()
-
-        current_net = psutil.net_io_counters()
-        self.system_stats['net_sent_rate'] = (current_net.bytes_sent - self.last_net_counters.bytes_sent) / self.args.interval
-        self.system_stats['net_recv_rate'] = (current_net.bytes_recv - self.last_net_counters.bytes_recv) / self.args.interval
+            if self._tick % 10 == 0:
+                self._system_stats_cache['net_if_addrs'] = psutil.net_if_addrs()
+                self._system_stats_cache['net_if_stats'] = psutil.net_if_stats()
+            if self._tick % 5 == 0:
+                self._system_stats_cache['net_connections'] = psutil.net_connections(kind='inet')
+
+        current_net = psutil.net_io_counters(pernic=False, nowrap=True)
+        self.system_stats['net_sent_rate'] = (current_net.bytes_sent - self.last_net_counters.bytes_sent) / self._elapsed
+        self.system_stats['net_recv_rate'] = (current_net.bytes_recv - self.last_net_counters.bytes_recv) / self._elapsed
         self.last_net_counters = current_net
 
-        current_disk = psutil.disk_io_counters()
-        self.system_stats['disk_read_rate'] = (current_disk.read_bytes - self.last_disk_io_counters.read_bytes) / self.args.interval
-        self.system_stats['disk_write_rate'] = (current_disk.write_bytes - self.last_disk_io_counters.write_bytes) / self.args.interval
+        current_disk = psutil.disk_io_counters(perdisk=False, nowrap=True)
+        self.system_stats['disk_read_rate'] = (current_disk.read_bytes - self.last_disk_io_counters.read_bytes) / self._elapsed
+        self.system_stats['disk_write_rate'] = (current_disk.write_bytes - self.last_disk_io_counters.write_bytes) / self._elapsed
         self.last_disk_io_counters = current_disk
 
-        self.system_stats['disk_partitions'] = []
-        try:
-            for part in psutil.disk_partitions():
-                usage = psutil.disk_usage(part.mountpoint)
-                self.system_stats['disk_partitions'].append({'device': part.device, 'mountpoint': part.mountpoint, 'usage': usage})
-        except (PermissionError, FileNotFoundError):
-            pass
+        if self._tick % 10 == 0:
+            self._system_stats_cache['users'] = psutil.users()
+            self._system_stats_cache['sensors_temperatures'] = self._get_sensor_data(lambda: psutil.sensors_temperatures())
+            self._system_stats_cache['sensors_fans'] = self._get_sensor_data(lambda: psutil.sensors_fans())
+            self._system_stats_cache['sensors_battery'] = self._get_sensor_data(lambda: psutil.sensors_battery())
+            self._system_stats_cache['disk_partitions'] = []
+            try:
+                for part in self._static['disk_partitions_list']:
+                    usage = psutil.disk_usage(part.mountpoint)
+                    self._system_stats_cache['disk_partitions'].append({'device': part.device, 'mountpoint': part.mountpoint, 'usage': usage})
+            except (PermissionError, FileNotFoundError):
+                pass
+        self.system_stats.update(self._system_stats_cache)
 
     def _gather_process_stats(self):
         """Gathers and returns statistics for running processes."""
         processes = []
-        current_procs = {p.pid: p for p in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'io_counters'])}
-
-        for pid, proc in current_procs.items():
+        new_last_io = {}
+        for p in iter_processes():
             try:
-                proc_info = proc.info
-                last_io = self.last_io_counters.get(pid)
-                if last_io:
-                    proc_info['read_rate'] = (proc_info['io_counters'].read_bytes - last_io.read_bytes) / self.args.interval
-                    proc_info['write_rate'] = (proc_info['io_counters'].write_bytes - last_io.write_bytes) / self.args.interval
-                else:
-                    proc_info['read_rate'] = 0.0
-                    proc_info['write_rate'] = 0.0
-                processes.append(proc_info)
+                with p.oneshot():
+                    try:
+                        io_counters = p.io_counters()
+                    except psutil.AccessDenied:
+                        io_counters = None
+                    proc_info = {'pid': p.pid, 'name': p.name(), 'cpu_percent': p.cpu_percent(),
+                                 'memory_percent': p.memory_percent(), 'io_counters': io_counters}
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-        self.last_io_counters = {p.pid: p.info['io_counters'] for p in current_procs.values() if p.info.get('io_counters')}
-        self.top_processes = sorted(processes, key=lambda p: p['cpu_percent'], reverse=True)
+                continue
+            last_io = self.last_io_counters.get(p.pid)
+            if last_io and io_counters:
+                proc_info['read_rate'] = (io_counters.read_bytes - last_io.read_bytes) / self._elapsed
+                proc_info['write_rate'] = (io_counters.write_bytes - last_io.write_bytes) / self._elapsed
+            else:
+                proc_info['read_rate'] = 0.0
+                proc_info['write_rate'] = 0.0
+            if io_counters:
+                new_last_io[p.pid] = io_counters
+            processes.append(proc_info)
+        self.last_io_counters = new_last_io
+        self.top_processes = heapq.nlargest(self.args.number, processes, key=_get_cpu)
 
     def _format_header(self):
         """Formats the main header section."""
-        lines = [f"{Fore.YELLOW}{Back.LIGHTBLUE_EX}--- RealNerdStats --- Press Ctrl+C to exit ---{Back.RESET}{Fore.RESET}"]
+        lines = [f"{Fore.YELLOW}{_BLB}--- RealNerdStats --- Press Ctrl+C to exit ---{_BR}{_FR}"]
         s = self.system_stats
         freq_str = f"{s['cpu_frequency'].current:.0f}MHz" if s['cpu_frequency'] else "N/A"
-        lines.append(f"{Fore.LIGHTBLUE_EX}Cores:{Fore.RESET} {s['cpu_cores_physical']} Physical, {s['cpu_cores_logical']} Logical | {Fore.LIGHTBLUE_EX}Freq:{Fore.RESET} {freq_str}")
+        lines.append(f"{_LB}Cores:{_FR} {s['cpu_cores_physical']} Physical, {s['cpu_cores_logical']} Logical | {_LB}Freq:{_FR} {freq_str}")
         
         vm, sm = s['virtual_memory'], s['swap_memory']
-        lines.append(f"{Fore.LIGHTBLUE_EX}RAM:{Fore.RESET} {format_bytes(vm.used, is_rate=False)}/{format_bytes(vm.total, is_rate=False)} ({vm.percent:.1f}%) | {Fore.LIGHTBLUE_EX}SWAP:{Fore.RESET} {format_bytes(sm.used, is_rate=False)}/{format_bytes(sm.total, is_rate=False)} ({sm.percent:.1f}%)")
+        lines.append(f"{_LB}RAM:{_FR} {format_bytes(vm.used, is_rate=False)}/{format_bytes(vm.total, is_rate=False)} ({vm.percent:.1f}%) | {_LB}SWAP:{_FR} {format_bytes(sm.used, is_rate=False)}/{format_bytes(sm.total, is_rate=False)} ({sm.percent:.1f}%)")
         
-        lines.append(f"{Fore.LIGHTBLUE_EX}DISK READ:{Fore.RESET} {format_bytes(s['disk_read_rate']):>10} | {Fore.LIGHTBLUE_EX}DISK WRITE:{Fore.RESET} {format_bytes(s['disk_write_rate']):>10}")
+        lines.append(f"{_LB}DISK READ:{_FR} {format_bytes(s['disk_read_rate']):>10} | {_LB}DISK WRITE:{_FR} {format_bytes(s['disk_write_rate']):>10}")
 
         for part in s['disk_partitions']:
             usage = part['usage']
-            lines.append(f"{Fore.LIGHTBLUE_EX}Disk ({part['mountpoint']}):{Fore.RESET} {format_bytes(usage.used, is_rate=False)}/{format_bytes(usage.total, is_rate=False)} ({usage.percent:.1f}%)")
+            lines.append(f"{_LB}Disk ({part['mountpoint']}):{_FR} {format_bytes(usage.used, is_rate=False)}/{format_bytes(usage.total, is_rate=False)} ({usage.percent:.1f}%)")
 
-        core_strings = [f"{Fore.LIGHTBLUE_EX}Core {i}:{Fore.RESET} {(Fore.RED if usage > 75.0 else '')}{usage:5.2f}%" for i, usage in enumerate(s['per_cpu_usage'])]
-        lines.append(f"{Fore.LIGHTBLUE_EX}CPU Total:{Fore.RESET} {s['overall_cpu']:5.2f}% | {Fore.LIGHTBLUE_EX}MEM:{Fore.RESET} {s['overall_mem']:5.2f}% | {Fore.LIGHTBLUE_EX}NET SENT:{Fore.RESET} {format_bytes(s['net_sent_rate']):>10} | {Fore.LIGHTBLUE_EX}NET RECV:{Fore.RESET} {format_bytes(s['net_recv_rate']):>10}")
+        core_strings = [pfx + (_RED if usage > 75.0 else '') + f"{usage:5.2f}%" for pfx, usage in zip(self._core_prefixes, s['per_cpu_usage'])]
+        lines.append(f"{_LB}CPU Total:{_FR} {s['overall_cpu']:5.2f}% | {_LB}MEM:{_FR} {s['overall_mem']:5.2f}% | {_LB}NET SENT:{_FR} {format_bytes(s['net_sent_rate']):>10} | {_LB}NET RECV:{_FR} {format_bytes(s['net_recv_rate']):>10}")
         lines.append(" | ".join(core_strings))
-        return lines
+        return "\n".join(lines)
 
     def _format_processes(self):
         """Formats the process list section."""
-        lines = [f"{Back.LIGHTBLUE_EX}{' ' * 80}{Back.RESET}",
-                 f"{Fore.LIGHTBLUE_EX}{'PID':>7} {'PROCESS NAME':<35} {'CPU %':>7} {'MEM %':>7} {'READ/s':>10} {'WRITE/s':>10}{Fore.RESET}"]
+        lines = [_HDR_BAR, self._process_header_row]
         
-        for i, proc in enumerate(self.top_processes[:self.args.number]):
-            read_str = format_bytes(proc.get('read_rate'), is_rate=True)
-            write_str = format_bytes(proc.get('write_rate'), is_rate=True)
-            cpu_color = Fore.RED if proc['cpu_percent'] > 75.0 else ""
-            bg_color = Back.LIGHTBLACK_EX if i % 2 == 0 else Back.RESET
-            lines.append(f"{bg_color}{proc['pid']:>7} {proc['name']:<35.35} {cpu_color}{proc['cpu_percent']:>7.2f}{Fore.RESET} {proc['memory_percent']:>7.2f} {read_str:>10} {write_str:>10}{Back.RESET}")
+        for i, proc in enumerate(self.top_processes):
+            lines.append(_ROW_FMT.format_map({
+                'bg': _BLBK if i % 2 == 0 else _BR,
+                'pid': proc['pid'],
+                'name': proc['name'],
+                'cpu_color': _RED if proc['cpu_percent'] > 75.0 else "",
+                'cpu': proc['cpu_percent'],
+                'mem': proc['memory_percent'],
+                'read': format_bytes(proc.get('read_rate'), is_rate=True),
+                'write': format_bytes(proc.get('write_rate'), is_rate=True),
+            }))
         
-        lines.append(f"{Back.LIGHTBLUE_EX}{' ' * 80}{Back.RESET}")
-        return lines
+        lines.append(_HDR_BAR)
+        return "\n".join(lines)
 
     def _format_system_info(self):
-        """Formats the 'Other System Information' section."""
+        """Formats the 'Other System Information' section, reusing the last render until its data refreshes."""
+        if self._cached_sysinfo_str is not None and self._tick - self._cached_sysinfo_tick < 10:
+            return self._cached_sysinfo_str
         lines = ["--- Other System Information ---"]
         s = self.system_stats
 
@@ -204,13 +272,17 @@ class RealNerdStats:
                     lines.append(f"  {battery.percent:.1f}% | Time Left: {secsleft_str} | Plugged: {'Yes' if battery.power_plugged else 'No'}")
             else:
                 lines.append(f"{Fore.LIGHTBLUE_EX}{label}:{Fore.RESET} N/A (or not supported)")
-        return lines
+        self._cached_sysinfo_str = "\n".join(lines)
+        self._cached_sysinfo_tick = self._tick
+        return self._cached_sysinfo_str
 
     def _format_network_info(self):
         """Formats the 'Network Details' section if requested."""
         if not self.args.network:
-            return []
-        
+            return ""
+        if self._cached_netinfo_str is not None and self._tick - self._cached_netinfo_tick < 5:
+            return self._cached_netinfo_str
+
         lines = ["--- Network Details ---"]
         s = self.system_stats
         
@@ -231,43 +303,59 @@ class RealNerdStats:
                 status = f"{Fore.GREEN}UP{Fore.RESET}" if stats.isup else f"{Fore.RED}DOWN{Fore.RESET}"
                 duplex_map = {psutil.NIC_DUPLEX_FULL: "Full", psutil.NIC_DUPLEX_HALF: "Half", psutil.NIC_DUPLEX_UNKNOWN: "Unknown"}
                 lines.append(f"  {Fore.LIGHTBLUE_EX}Stats:{Fore.RESET} Status: {status}, Speed: {stats.speed}Mb, Duplex: {duplex_map[stats.duplex]}")
-        return lines
+        self._cached_netinfo_str = "\n".join(lines)
+        self._cached_netinfo_tick = self._tick
+        return self._cached_netinfo_str
 
     def _log_to_csv(self, timestamp):
         """Writes the current data to the CSV file."""
         if not self.csv_writer:
             return
         s = self.system_stats
-        for proc in self.top_processes[:self.args.number]:
-            self.csv_writer.writerow([
+        rows = []
+        for proc in self.top_processes:
+            rows.append([
                 timestamp, s['overall_cpu'], s['overall_mem'], s['net_sent_rate'], s['net_recv_rate'],
                 proc['pid'], proc['name'], proc['cpu_percent'], proc['memory_percent'],
                 proc.get('read_rate', 0.0), proc.get('write_rate', 0.0)
             ])
+        self.csv_writer.writerows(rows)
+        self._csv_tick += 1
+        if self._csv_tick % 30 == 0:
+            self.csv_file.flush()
 
     def run(self):
         """Main application loop."""
+        next_tick = time.monotonic() + self.args.interval
         try:
             while True:
-                loop_start_time = time.time()
+                now = time.monotonic()
+                self._elapsed = (now - self._last_sample_time) or self.args.interval
+                self._last_sample_time = now
+                timestamp = time.time()
 
                 self._gather_system_stats()
                 self._gather_process_stats()
 
-                output_lines = []
-                output_lines.extend(self._format_header())
-                output_lines.extend(self._format_processes())
-                output_lines.extend(self._format_system_info())
-                output_lines.extend(self._format_network_info())
+                sections = (self._format_header(), self._format_processes(),
+                            self._format_system_info(), self._format_network_info())
 
-                self._log_to_csv(loop_start_time)
+                self._log_to_csv(timestamp)
 
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("\n".join(output_lines))
+                out = sys.stdout
+                out.write(_CLEAR)
+                out.write("\n".join(section for section in sections if section))
+                out.write("\n")
+                out.flush()
 
-                work_duration = time.time() - loop_start_time
-                sleep_time = max(0, self.args.interval - work_duration)
-                time.sleep(sleep_time)
+                now = time.monotonic()
+                sleep_for = next_tick - now
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                else:
+                    next_tick = now
+                next_tick += self.args.interval
+                self._tick += 1
 
         except KeyboardInterrupt:
             print("\nExiting RealNerdStats.")